@@ -5,6 +5,7 @@ SortEX – sort images and videos by date (EXIF) into folders "YYYY-MM".
 GUI with Tkinter to select source folder. Works on Windows/macOS/Linux.
 Requires: Pillow (pip install pillow)
 Optional: pillow-heif for HEIC/HEIF (pip install pillow-heif)
+Optional: vexy-glob for faster scanning of very large libraries (pip install vexy-glob)
 
 iCloud adjustments:
 - Skips .aae sidecar files.
@@ -15,15 +16,22 @@ iCloud adjustments:
 import os
 import sys
 import shutil
+import struct
+import mmap
+import calendar
 from pathlib import Path
 from datetime import datetime
 import threading
+import time
 import queue
-from typing import Dict, List, Tuple, Optional
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Set, Tuple, Optional
 
 # --- Dependencies ---
 try:
-    from PIL import Image, ExifTags
+    from PIL import Image
 except ImportError:
     print("This script requires Pillow. Install with: pip install pillow")
     sys.exit(1)
@@ -36,45 +44,133 @@ try:
 except Exception:
     HEIC_SUPPORTED = False
 
+# Rust-based parallel file finder if available (only used to walk the source folder)
+try:
+    import vexy_glob  # type: ignore
+    VEXY_GLOB_SUPPORTED = True
+except ImportError:
+    VEXY_GLOB_SUPPORTED = False
+
 # --- Tkinter GUI ---
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
-# EXIF tags we can use
-_EXIF_DATETIME_CANDIDATES = [
-    "DateTimeOriginal",  # most common
-    "CreateDate",
-    "DateTimeDigitized",
-    "DateTime",          # fallback
-]
+# EXIF tags we can use, by tag ID, in order of preference:
+#   DateTimeOriginal  (0x9003, Exif sub-IFD) – most common
+#   DateTimeDigitized (0x9004, Exif sub-IFD)
+#   DateTime          (0x0132, IFD0)         – fallback
+_EXIF_TAG_DATETIME_ORIGINAL = 0x9003
+_EXIF_TAG_DATETIME_DIGITIZED = 0x9004
+_EXIF_TAG_DATETIME = 0x0132
+_EXIF_TAG_EXIF_IFD = 0x8769  # pointer from IFD0 to the Exif sub-IFD
+_EXIF_DATETIME_TAG_IDS = (_EXIF_TAG_DATETIME_ORIGINAL, _EXIF_TAG_DATETIME_DIGITIZED, _EXIF_TAG_DATETIME)
+
+# EXIF lives in APP1 right after SOI, so the first 128 KB is enough for JPEGs
+_JPEG_HEADER_SCAN_BYTES = 131072
+
+# Worker -> UI progress updates are sent at most every N files or every T seconds
+PROGRESS_EVERY_FILES = 64
+PROGRESS_EVERY_SECONDS = 0.1
 
 # Folder name for files without date
 UNKNOWN_DIR_NAME = "unknown-date"
 
 # File extensions we handle (images + videos)
 IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".heic", ".heif", ".webp"}
+JPEG_EXTS = {".jpg", ".jpeg"}
+HEIF_EXTS = {".heic", ".heif"}
 VIDEO_EXTS = {".mov", ".mp4", ".avi", ".mpeg"}
 IGNORE_EXTS = {".aae"}  # iCloud sidecar
+MEDIA_EXTS = frozenset((IMAGE_EXTS | VIDEO_EXTS) - IGNORE_EXTS)
 
-def is_media_file(path: Path) -> bool:
-    ext = path.suffix.lower()
-    return ext in IMAGE_EXTS or ext in VIDEO_EXTS
+# Date lookups are I/O bound, so use plenty of threads for them
+DATE_WORKERS = (os.cpu_count() or 1) * 4
+# On Windows os.scandir gets stat data with the directory listing, so DirEntry.stat()
+# costs nothing; elsewhere it is an extra syscall per file
+_SCANDIR_STAT_IS_FREE = os.name == "nt"
+# Max. number of walked-but-not-yet-dated files buffered between the walker and the date workers
+WALK_QUEUE_SIZE = 1024
 
-def is_image_file(path: Path) -> bool:
-    return path.suffix.lower() in IMAGE_EXTS
+class MediaEntry(NamedTuple):
+    """
+    A collected media file. Folder, stem and image flag are worked out once during
+    the directory walk so pairing and dispatch never re-parse the path.
+    mtime comes from the walk where that is cheap, otherwise it is None and the file
+    is stat'ed later if needed.
+    """
+    path: Path
+    parent: str
+    stem: str
+    is_image: bool
+    mtime: Optional[float] = None
 
-def is_video_file(path: Path) -> bool:
-    return path.suffix.lower() in VIDEO_EXTS
+def _scandir_walk(root: Path, recurse: bool) -> Iterator[MediaEntry]:
+    """
+    Yield media files below root as they are found, using os.scandir. Only the entry
+    name is looked at for the extension check, so no Path objects are built for files we ignore.
+    """
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recurse:
+                                stack.append(entry.path)
+                            continue
+                        name = entry.name
+                        dot = name.rfind(".")
+                        if dot <= 0:
+                            continue
+                        ext = name[dot:].lower()
+                        if ext not in MEDIA_EXTS:
+                            continue
+                        if entry.is_file():
+                            is_image = ext in IMAGE_EXTS
+                            # Videos are always dated by mtime; photos only need it without EXIF
+                            mtime = entry.stat().st_mtime if not is_image or _SCANDIR_STAT_IS_FREE else None
+                            yield MediaEntry(Path(entry.path), d, name[:dot], is_image, mtime)
+                    except OSError:
+                        continue
+        except OSError:
+            continue  # unreadable folder – skip it like rglob does
+
+def _vexy_glob_walk(root: Path, recurse: bool) -> Iterator[MediaEntry]:
+    """
+    Same as _scandir_walk, but lets vexy_glob do the (GIL-free, parallel) walking.
+    Falls back to _scandir_walk if the vexy_glob.find() call itself raises.
+    Yields the same files as _scandir_walk: ignore files (.gitignore etc.) are not honoured,
+    symlinked folders are not descended into, symlinked files are kept.
+    """
+    try:
+        # No file_type="f": that would drop symlinked files, so files are checked below
+        found = iter(vexy_glob.find("**/*" if recurse else "*", root=str(root), hidden=True,
+                                    ignore_git=True, max_depth=None if recurse else 1))
+    except Exception:
+        yield from _scandir_walk(root, recurse)
+        return
+    for p in found:
+        p = str(p)
+        d, name = os.path.split(p)
+        dot = name.rfind(".")
+        if dot <= 0:
+            continue
+        ext = name[dot:].lower()  # filter here so .JPG/.MOV match regardless of case
+        if ext in MEDIA_EXTS and os.path.isfile(p):  # follows symlinks, like DirEntry.is_file()
+            yield MediaEntry(Path(d, name), d, name[:dot], ext in IMAGE_EXTS)
 
-def _exif_dict_from_image(img: Image.Image):
-    exif = img.getexif()
-    if not exif:
-        return {}
-    out = {}
-    for tag_id, value in exif.items():
-        tag = ExifTags.TAGS.get(tag_id, tag_id)
-        out[str(tag)] = value
-    return out
+def _datetime_from_fields(year: str, month: str, day: str, hour: str, minute: str, second: str) -> Optional[datetime]:
+    """
+    Build a datetime from all-digit strings, validating instead of catching ValueError.
+    """
+    y, mo, d, h, mi, sec = int(year), int(month), int(day), int(hour), int(minute), int(second)
+    if y < 1 or not 1 <= mo <= 12 or not 1 <= d <= calendar.monthrange(y, mo)[1]:
+        return None  # e.g. "0000:00:00 00:00:00" placeholders
+    if h > 23 or mi > 59 or sec > 59:
+        return None
+    return datetime(y, mo, d, h, mi, sec)
 
 def parse_exif_datetime(value: str):
     """
@@ -83,6 +179,17 @@ def parse_exif_datetime(value: str):
     if not value:
         return None
 
+    # Fast path: "YYYY?MM?DD HH:MM[:SS]" with ? one of ":", "-", "/" (canonical EXIF is
+    # "YYYY:MM:DD HH:MM:SS") is parsed by position, without strptime or exceptions
+    v = str(value)
+    n = len(v)
+    if ((n == 19 or n == 16) and v[4] in ":-/" and v[7] == v[4] and v[10] == " " and v[13] == ":"
+            and (n == 16 or v[16] == ":")):
+        fields = (v[:4], v[5:7], v[8:10], v[11:13], v[14:16], v[17:19] if n == 19 else "0")
+        if all(f.isdecimal() for f in fields):
+            return _datetime_from_fields(*fields)
+
+    # Anything else (e.g. unpadded or space-padded fields) still goes through strptime
     fmts = [
         "%Y:%m:%d %H:%M:%S",
         "%Y:%m:%d %H:%M",
@@ -93,54 +200,224 @@ def parse_exif_datetime(value: str):
     ]
     for fmt in fmts:
         try:
-            return datetime.strptime(str(value), fmt)
+            return datetime.strptime(v, fmt)
         except Exception:
             continue
     return None
 
-def get_image_datetime(path: Path):
+def _scan_tiff_ifd(data, base: int, end: int, ifd_offset: int, endian: str, wanted, found: Dict[int, object]):
+    """
+    Walk one TIFF IFD and store the values of the wanted tags in `found`.
+    ASCII values are returned as str, everything else as the raw 4-byte value/offset.
+    """
+    pos = base + ifd_offset
+    if pos + 2 > end:
+        return
+    count = struct.unpack_from(endian + "H", data, pos)[0]
+    pos += 2
+    if pos + 12 * count > end:
+        return
+    for _ in range(count):
+        tag, typ, n, value = struct.unpack_from(endian + "HHII", data, pos)
+        pos += 12
+        if tag not in wanted:
+            continue
+        if typ == 2:  # ASCII
+            start = pos - 4 if n <= 4 else base + value
+            if start + n <= end:
+                found[tag] = data[start:start + n].split(b"\x00", 1)[0].decode("ascii", "replace")
+        else:
+            found[tag] = value
+
+def _fast_jpeg_exif_datetime(path: Path) -> Optional[str]:
+    """
+    Map only the JPEG header into memory and pull the raw EXIF datetime string out of
+    APP1, without letting Pillow open the image. Returns None if nothing was found,
+    raises ValueError if the file is not a JPEG at all (e.g. a misnamed HEIC).
+    """
+    with open(path, "rb") as f:
+        n = min(os.fstat(f.fileno()).st_size, _JPEG_HEADER_SCAN_BYTES)
+        if n < 4:
+            raise ValueError("not a JPEG file")
+        try:
+            m = mmap.mmap(f.fileno(), n, access=mmap.ACCESS_READ)
+        except OSError:
+            # Some filesystems can't be mapped (FUSE direct_io, some network shares)
+            data = f.read(n)
+            return _jpeg_app1_datetime(data, len(data))
+        with m:
+            return _jpeg_app1_datetime(m, n)
+
+def _jpeg_app1_datetime(data, n: int) -> Optional[str]:
+    """
+    Walk the JPEG segment markers in the first n bytes of data (bytes or mmap)
+    and return the EXIF datetime string from APP1, if any.
+    """
+    if data[:2] != b"\xff\xd8":
+        raise ValueError("not a JPEG file")
+
+    pos = 2
+    while pos + 4 <= n:
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:  # fill byte
+            pos += 1
+            continue
+        if marker in (0xD9, 0xDA):  # EOI / SOS: no metadata after this
+            return None
+        seg_len = struct.unpack_from(">H", data, pos + 2)[0]
+        if marker == 0xE1 and data[pos + 4:pos + 10] == b"Exif\x00\x00":
+            base = pos + 10
+            end = min(pos + 2 + seg_len, n)
+            order = data[base:base + 2]
+            if order == b"II":
+                endian = "<"
+            elif order == b"MM":
+                endian = ">"
+            else:
+                return None
+            if base + 8 > end:
+                return None
+            ifd0 = struct.unpack_from(endian + "I", data, base + 4)[0]
+
+            found: Dict[int, object] = {}
+            _scan_tiff_ifd(data, base, end, ifd0, endian, (_EXIF_TAG_DATETIME, _EXIF_TAG_EXIF_IFD), found)
+            exif_ifd = found.get(_EXIF_TAG_EXIF_IFD)
+            if isinstance(exif_ifd, int):
+                _scan_tiff_ifd(data, base, end, exif_ifd, endian,
+                               (_EXIF_TAG_DATETIME_ORIGINAL, _EXIF_TAG_DATETIME_DIGITIZED), found)
+            for tag in _EXIF_DATETIME_TAG_IDS:
+                value = found.get(tag)
+                if isinstance(value, str) and value:
+                    return value
+            return None
+        pos += 2 + seg_len
+    return None
+
+def get_image_datetime(path: Path, mtime: Optional[float] = None):
     """
     Try to get photo datetime from EXIF. Fallback to file's mtime if is EXIF missing.
     Returns (dt, source) where source is 'exif' or 'mtime' or None.
+    A known mtime can be passed in to save the stat call.
+    JPEGs are read via the header-only scanner and never opened with Pillow (unless the
+    file turns out not to be a JPEG); HEIC/HEIF only go to Pillow if pillow-heif is there.
+    """
+    ext = path.suffix.lower()
+    if ext in JPEG_EXTS:
+        try:
+            dt = parse_exif_datetime(_fast_jpeg_exif_datetime(path))
+        except ValueError:
+            dt = _pillow_exif_datetime(path)
+        except OSError:
+            dt = None
+    elif ext not in HEIF_EXTS or HEIC_SUPPORTED:
+        dt = _pillow_exif_datetime(path)
+    else:
+        dt = None  # Pillow can't open HEIC/HEIF without pillow-heif
+    if dt:
+        return dt, "exif"
+
+    return _mtime_datetime(path, mtime)
+
+def _pillow_exif_datetime(path: Path) -> Optional[datetime]:
+    """
+    EXIF datetime via Pillow, for the formats the header scanner does not handle.
     """
+    # Look the tags up by ID – no need to map every EXIF tag to its name.
+    # getexif() only holds IFD0; DateTimeOriginal/Digitized live in the Exif sub-IFD
+    # (some writers put them in IFD0 anyway, so check both).
     try:
         with Image.open(path) as img:
-            exif = _exif_dict_from_image(img)
-            for key in _EXIF_DATETIME_CANDIDATES:
-                if key in exif:
-                    dt = parse_exif_datetime(exif[key])
-                    if dt:
-                        return dt, "exif"
+            exif = img.getexif()
+            sub = exif.get_ifd(_EXIF_TAG_EXIF_IFD)
+            for tag_id in _EXIF_DATETIME_TAG_IDS:
+                dt = parse_exif_datetime(sub.get(tag_id) or exif.get(tag_id))
+                if dt:
+                    return dt
     except Exception:
-        pass
+        pass  # not an image Pillow can open
+    return None
+
+@lru_cache(maxsize=None)
+def _cached_mtime(path_str: str) -> Optional[float]:
+    """
+    st_mtime of a file, stat'ed at most once per run (see _clear_caches).
+    """
+    try:
+        return os.stat(path_str).st_mtime
+    except OSError:
+        return None
 
+def _mtime_datetime(path: Path, mtime: Optional[float] = None):
+    """
+    Returns (dt, 'mtime') from the file's modification time, or (None, None).
+    """
+    ts = mtime if mtime is not None else _cached_mtime(str(path))
+    if ts is None:
+        return None, None
     try:
-        ts = path.stat().st_mtime
         return datetime.fromtimestamp(ts), "mtime"
     except Exception:
         return None, None
 
+@lru_cache(maxsize=None)
+def _cached_date(path_str: str, mtime: Optional[float]):
+    """
+    get_image_datetime, computed at most once per path per run.
+    """
+    return get_image_datetime(Path(path_str), mtime)
+
+def _clear_caches():
+    # Files get moved between runs, so cached results only hold for one run
+    _cached_date.cache_clear()
+    _cached_mtime.cache_clear()
+
 def build_target_dirname(dt: datetime):
     mm = f"{dt.month:02d}"
     yyyy = f"{dt.year:02d}"
     return f"{yyyy}-{mm}"
 
-def ensure_unique_path(target: Path) -> Path:
+def ensure_unique_path(target: Path, counters: Optional[Dict[Tuple[Path, str, str], int]] = None) -> Path:
     """
     If file exists – add a running suffix _1, _2, ...
+    With `counters`, the search for a name continues from the last suffix handed out
+    for the same (folder, stem, suffix) instead of starting at _1 again.
     """
     if not target.exists():
         return target
     stem = target.stem
     suffix = target.suffix
     parent = target.parent
-    i = 1
+    key = (parent, stem, suffix)
+    i = counters.get(key, 1) if counters is not None else 1
     while True:
         candidate = parent / f"{stem}_{i}{suffix}"
         if not candidate.exists():
+            if counters is not None:
+                counters[key] = i + 1
             return candidate
         i += 1
 
+def copy_file_fast(src: Path, dst: Path):
+    """
+    Like shutil.copy2, but on Linux let the kernel copy the data with os.copy_file_range
+    (server-side / reflink copies on filesystems that support it).
+    Falls back to shutil.copy2 wherever that is not available.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                infd, outfd = fsrc.fileno(), fdst.fileno()
+                while os.copy_file_range(infd, outfd, 1 << 30):
+                    pass
+        except OSError:
+            pass  # e.g. EXDEV/ENOSYS – shutil.copy2 starts over
+        else:
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
 class ImageSorterApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -153,7 +430,8 @@ class ImageSorterApp(tk.Tk):
         self.include_unknown = tk.BooleanVar(value=True)  # put files without date in "unknown-date"
         self.process_subdirs = tk.BooleanVar(value=True)  # include subfolders
 
-        self.log_queue = queue.Queue()
+        # Worker -> UI messages; deque append/popleft are atomic, so no Queue locking needed
+        self.log_queue = collections.deque()
 
         self.create_widgets()
         self.after(100, self._process_log_queue)
@@ -210,25 +488,44 @@ class ImageSorterApp(tk.Tk):
         if d:
             self.source_dir.set(d)
 
-    def _collect_files(self, src: Path):
-        if self.process_subdirs.get():
-            return [p for p in src.rglob("*") if p.is_file() and is_media_file(p) and p.suffix.lower() not in IGNORE_EXTS]
-        else:
-            return [p for p in src.glob("*") if p.is_file() and is_media_file(p) and p.suffix.lower() not in IGNORE_EXTS]
+    def _collect_files(self, src: Path) -> Iterator[MediaEntry]:
+        recurse = self.process_subdirs.get()
+        if VEXY_GLOB_SUPPORTED:
+            return _vexy_glob_walk(src, recurse)
+        return _scandir_walk(src, recurse)
 
     def _log(self, msg: str):
-        self.log_queue.put(msg)
+        self.log_queue.append(msg)
 
     def _process_log_queue(self):
-        try:
-            while True:
-                msg = self.log_queue.get_nowait()
-                self.txt.configure(state="normal")
-                self.txt.insert("end", msg + "\n")
-                self.txt.see("end")
-                self.txt.configure(state="disabled")
-        except queue.Empty:
-            pass
+        # Drain everything queued since the last tick and insert it in one go.
+        # Items are log lines (str), ("maximum" | "progress", value) for the progress bar,
+        # or ("done", None) when the worker has finished.
+        msgs = []
+        progress = None
+        done = False
+        log_queue = self.log_queue
+        while log_queue:
+            item = log_queue.popleft()
+            if isinstance(item, tuple):
+                kind, value = item
+                if kind == "maximum":
+                    self.progress.configure(maximum=value)
+                elif kind == "done":
+                    done = True
+                else:
+                    progress = value
+            else:
+                msgs.append(item)
+        if progress is not None:
+            self.progress.configure(value=progress)
+        if msgs:
+            self.txt.configure(state="normal")
+            self.txt.insert("end", "\n".join(msgs) + "\n")
+            self.txt.see("end")
+            self.txt.configure(state="disabled")
+        if done:
+            self._done()
         self.after(100, self._process_log_queue)
 
     def run_dry(self):
@@ -251,126 +548,197 @@ class ImageSorterApp(tk.Tk):
         worker = threading.Thread(target=self._worker, args=(src, dry_run), daemon=True)
         worker.start()
 
-    def _pair_live_photos(self, files: List[Path]) -> Tuple[Dict[Path, List[Path]], List[Path]]:
+    def _pair_live_photos(self, files: List[MediaEntry]) -> Tuple[Dict[MediaEntry, List[Path]], List[MediaEntry]]:
         """
         Create pairs for Live Photos:
         - If a video (.mov/.mp4) has the same stem as a photo in the same folder, pair them.
         - Returns:
-            pairs: {photo_path: [associated videos]}
-            singles: files not paired (including photos and videos).
+            pairs: {photo_entry: [associated video paths]}
+            singles: entries not paired (including photos and videos).
         """
-        by_dir: Dict[Path, Dict[str, List[Path]]] = {}
-        for p in files:
-            by_dir.setdefault(p.parent, {}).setdefault(p.stem, []).append(p)
-
-        pairs: Dict[Path, List[Path]] = {}
-        singles: List[Path] = []
-        for parent, stems in by_dir.items():
-            for stem, items in stems.items():
-                images = [x for x in items if is_image_file(x)]
-                videos = [x for x in items if is_video_file(x)]
-                if images and videos:
-                    master = sorted(images)[0]
-                    pairs.setdefault(master, []).extend(sorted(videos))
-                    for extra_img in images[1:]:
-                        singles.append(extra_img)
-                else:
-                    singles.extend(items)
-        singles = list(dict.fromkeys(singles))
-        in_pairs = set()
-        for master, vids in pairs.items():
-            in_pairs.add(master)
-            in_pairs.update(vids)
-        singles = [p for p in singles if p not in in_pairs]
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        for i, e in enumerate(files):
+            groups.setdefault((e.parent, e.stem), []).append(i)
+
+        pairs: Dict[MediaEntry, List[Path]] = {}
+        singles: List[MediaEntry] = []
+        for idxs in groups.values():
+            if len(idxs) == 1:
+                singles.append(files[idxs[0]])
+                continue
+            images = sorted(files[i] for i in idxs if files[i].is_image)
+            videos = [files[i].path for i in idxs if not files[i].is_image]
+            if images and videos:
+                # Each (folder, stem) group yields at most one pair, so nothing can end up twice
+                pairs[images[0]] = sorted(videos)
+                singles.extend(images[1:])
+            else:
+                singles.extend(files[i] for i in idxs)
         return pairs, singles
 
+    def _scan_and_date(self, src: Path) -> List[MediaEntry]:
+        """
+        Walk src in a producer thread and feed the entries through a bounded queue to a
+        pool of date workers, so photos are dated (into the _cached_date cache) while the
+        walk is still running. Returns all collected entries once both are finished;
+        an error raised by the walk is re-raised here, before anything gets moved.
+        """
+        walk = self._collect_files(src)
+        entry_q: "queue.Queue[Optional[MediaEntry]]" = queue.Queue(maxsize=WALK_QUEUE_SIZE)
+        files: List[MediaEntry] = []
+        walk_errors: List[BaseException] = []
+
+        def produce():
+            try:
+                for e in walk:
+                    entry_q.put(e)
+            except BaseException as exc:
+                walk_errors.append(exc)
+            finally:
+                for _ in range(DATE_WORKERS):
+                    entry_q.put(None)  # one stop marker per date worker
+
+        def consume():
+            while True:
+                e = entry_q.get()
+                if e is None:
+                    return
+                files.append(e)
+                if e.is_image:
+                    _cached_date(str(e.path), e.mtime)
+
+        walker = threading.Thread(target=produce, daemon=True)
+        walker.start()
+        with ThreadPoolExecutor(max_workers=DATE_WORKERS) as executor:
+            for fut in [executor.submit(consume) for _ in range(DATE_WORKERS)]:
+                fut.result()
+        walker.join()
+        if walk_errors:
+            raise walk_errors[0]
+        files.sort()  # workers append in arbitrary order; keep runs reproducible
+        return files
+
     def _worker(self, src: Path, dry_run: bool):
+        _clear_caches()
         try:
-            files = self._collect_files(src)
+            try:
+                files = self._scan_and_date(src)
+            except Exception as e:
+                self._log(f"Error while scanning {src}: {e!r}")
+                return
             total = len(files)
             if total == 0:
                 self._log("Found no media.")
-                self._done()
                 return
 
+            # Read the Tk variables (and build the log verb) once instead of per file
+            copy_mode = self.copy_mode.get()
+            include_unknown = self.include_unknown.get()
+            if dry_run:
+                action = "Would copy" if copy_mode else "Would move"
+            else:
+                action = "Copied" if copy_mode else "Moved"
+            # Paths below src, for the log, by slicing instead of Path.relative_to
+            src_prefix_len = len(os.path.join(str(src), ""))
+
             pairs, singles = self._pair_live_photos(files)
             total_ops = len(pairs) + len(singles)
-            self.progress.configure(maximum=total_ops)
+            self.log_queue.append(("maximum", total_ops))
             n_done = 0
+            last_sent = 0
+            last_ts = time.monotonic()
+
+            def advance():
+                # Tk widgets must only be touched from the UI thread, so progress goes via the queue
+                nonlocal n_done, last_sent, last_ts
+                n_done += 1
+                now = time.monotonic()
+                if n_done - last_sent >= PROGRESS_EVERY_FILES or now - last_ts > PROGRESS_EVERY_SECONDS:
+                    self.log_queue.append(("progress", n_done))
+                    last_sent, last_ts = n_done, now
+
+            target_devs: Dict[Path, int] = {}
+            created_dirs: Set[Path] = set()
+            name_counters: Dict[Tuple[Path, str, str], int] = {}
 
             def move_or_copy(path: Path, target_dir: Path) -> Path:
-                if not dry_run:
+                if not dry_run and target_dir not in created_dirs:
                     target_dir.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(target_dir)
                 target = target_dir / path.name
-                final_target = ensure_unique_path(target)
+                final_target = ensure_unique_path(target, name_counters)
                 if dry_run:
                     return final_target
-                if self.copy_mode.get():
-                    shutil.copy2(path, final_target)
+                if copy_mode:
+                    copy_file_fast(path, final_target)
                 else:
-                    shutil.move(str(path), str(final_target))
+                    dev = target_devs.get(target_dir)
+                    if dev is None:
+                        dev = target_devs[target_dir] = os.stat(target_dir).st_dev
+                    if os.stat(path).st_dev == dev:
+                        os.replace(path, final_target)  # same filesystem: plain rename
+                    else:
+                        shutil.move(str(path), str(final_target))
                 return final_target
 
-            for master_img, videos in pairs.items():
-                dt, source = get_image_datetime(master_img) if is_image_file(master_img) else (None, None)
-                if not dt and not self.include_unknown.get():
-                    self._log(f"Skipping (no date found): {master_img.relative_to(src)} (+ {len(videos)} video)")
-                    n_done += 1
-                    self.progress.configure(value=n_done)
+            # Photo dates are already in the _cached_date cache; move/copy serially
+            # so destination folders are never raced on
+            for master, videos in pairs.items():
+                master_img = master.path
+                master_str = str(master_img)
+                rel = master_str[src_prefix_len:]
+                dt, source = _cached_date(master_str, master.mtime)
+                if not dt and not include_unknown:
+                    self._log(f"Skipping (no date found): {rel} (+ {len(videos)} video)")
+                    advance()
                     continue
                 dirname = build_target_dirname(dt) if dt else UNKNOWN_DIR_NAME
                 target_dir = src / dirname
 
                 final_master = move_or_copy(master_img, target_dir)
                 src_label = f" ({source})" if source else ""
-                action = "Would " + ("copy" if self.copy_mode.get() else "move") if dry_run else ("Copied" if self.copy_mode.get() else "Moved")
-                self._log(f"{action}: {master_img.relative_to(src)}  ->  {dirname}/{final_master.name}{src_label}")
+                self._log(f"{action}: {rel}  ->  {dirname}/{final_master.name}{src_label}")
 
                 for v in videos:
                     final_v = move_or_copy(v, target_dir)
-                    self._log(f"{action}: {v.relative_to(src)}  ->  {dirname}/{final_v.name} (paired with photo)")
+                    self._log(f"{action}: {str(v)[src_prefix_len:]}  ->  {dirname}/{final_v.name} (paired with photo)")
 
-                n_done += 1
-                self.progress.configure(value=n_done)
+                advance()
 
-            for path in singles:
-                rel = path.relative_to(src)
+            for entry in singles:
+                path = entry.path
+                path_str = str(path)
+                rel = path_str[src_prefix_len:]
                 try:
-                    if is_image_file(path):
-                        dt, source = get_image_datetime(path)
+                    if entry.is_image:
+                        dt, source = _cached_date(path_str, entry.mtime)
                     else:
-                        try:
-                            ts = path.stat().st_mtime
-                            dt, source = datetime.fromtimestamp(ts), "mtime"
-                        except Exception:
-                            dt, source = None, None
+                        dt, source = _mtime_datetime(path, entry.mtime)
 
                     if dt:
                         dirname = build_target_dirname(dt)
                     else:
-                        if not self.include_unknown.get():
+                        if not include_unknown:
                             self._log(f"Skipping (no date found): {rel}")
-                            n_done += 1
-                            self.progress.configure(value=n_done)
+                            advance()
                             continue
                         dirname = UNKNOWN_DIR_NAME
 
                     target_dir = src / dirname
                     final_target = move_or_copy(path, target_dir)
 
-                    action = "Would " + ("copy" if self.copy_mode.get() else "move") if dry_run else ("Copied" if self.copy_mode.get() else "Moved")
                     src_label = f" ({source})" if source else ""
                     self._log(f"{action}: {rel}  ->  {dirname}/{final_target.name}{src_label}")
 
                 except Exception as e:
                     self._log(f"Error with {rel}: {e!r}")
 
-                n_done += 1
-                self.progress.configure(value=n_done)
+                advance()
 
+            self.log_queue.append(("progress", n_done))
             self._log("Done!")
         finally:
-            self._done()
+            self.log_queue.append(("done", None))
 
     def _done(self):
         self.btn_go.configure(state="normal")